@@ -1,65 +1,167 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import random
 import re
 import shutil
 import subprocess
-import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 import requests
-from gtts import gTTS
+from gtts import gTTS, gTTSError
 from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional: native PDFium text extraction is much faster than pypdf
+    pdfium = None
+
+try:
+    import mutagen
+except ImportError:  # optional: reads audio duration from headers without spawning ffprobe
+    mutagen = None
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+IMAGE_MIME_SUFFIXES = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+TTS_MAX_ATTEMPTS = 4
+DEFAULT_TTS_MAX_CHARS = 3500
+MAX_CHARS_BY_LANG = {"hi": 2500, "en": 4500}
+DOWNLOAD_WORKERS = 8
+MAX_IMAGE_BYTES = 15 * 1024 * 1024
+PARALLEL_PDF_MIN_PAGES = 16
+SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+TTS_CACHE_DIR = Path("output/tts_cache")
+TTS_CHUNK_VERSION = 1  # bump when split_text_for_tts changes where chunks break
+TEXT_CACHE_DIR = Path.home() / ".cache" / "hindi_audiobook"
+CACHE_VERSION = 2  # bump when extracted text changes so old cache entries are not reused
+VIDEO_CODECS = ("libx264", "h264_nvenc", "h264_videotoolbox", "h264_vaapi")
+SLIDESHOW_FPS = 5
+MAX_FILTER_GRAPH_IMAGES = 64
+VIDEO_SCALE_FILTER = "scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2"
+
+_WS_RE = re.compile(r"\s+")
+_SENT_END_RE = re.compile(r"[।.!?]\s+")
+
+_PDF_DOCUMENTS: dict[str, object] = {}
+
+
+def _open_pdf(pdf_path: str):
+    if os.path.getsize(pdf_path) == 0:
+        raise ValueError(f"No extractable text found in PDF: {pdf_path}")
+    if pdfium is not None:
+        return pdfium.PdfDocument(pdf_path)
+    # A read-only mmap spares pypdf its whole-file BytesIO copy, so workers share the page cache.
+    with open(pdf_path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return PdfReader(mapped, strict=False)
+
+
+def _pdf_page_count(document) -> int:
+    if pdfium is not None:
+        return len(document)
+    return len(document.pages)
+
+
+def _pdf_page_text(document, page_idx: int) -> str:
+    if pdfium is not None:
+        text = document[page_idx].get_textpage().get_text_range() or ""
+        return text.replace("\r\n", "\n").strip()
+    return (document.pages[page_idx].extract_text() or "").strip()
+
+
+def _extract_page(job: tuple[str, int]) -> str:
+    # Each worker process keeps its own parsed document.
+    pdf_path, page_idx = job
+    document = _PDF_DOCUMENTS.get(pdf_path)
+    if document is None:
+        document = _PDF_DOCUMENTS[pdf_path] = _open_pdf(pdf_path)
+    return _pdf_page_text(document, page_idx)
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
-    reader = PdfReader(str(pdf_path))
-    pages = [(page.extract_text() or "").strip() for page in reader.pages]
+    document = _open_pdf(str(pdf_path))
+    page_count = _pdf_page_count(document)
+    workers = min(os.cpu_count() or 1, 8)
+    if workers == 1 or page_count < PARALLEL_PDF_MIN_PAGES:
+        pages = [_pdf_page_text(document, idx) for idx in range(page_count)]
+    else:
+        jobs = [(str(pdf_path), idx) for idx in range(page_count)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(_extract_page, jobs, chunksize=8))
+
     text = "\n".join(page for page in pages if page).strip()
     if not text:
         raise ValueError(f"No extractable text found in PDF: {pdf_path}")
     return text
 
 
-def split_text_for_tts(text: str, max_chars: int = 3500) -> list[str]:
-    clean_text = re.sub(r"\s+", " ", text).strip()
+def _cached_text(cache_key: str, compute: Callable[[], str]) -> str:
+    versioned_key = f"v{CACHE_VERSION}\0{cache_key}"
+    cache_path = TEXT_CACHE_DIR / f"{hashlib.sha256(versioned_key.encode('utf-8')).hexdigest()}.txt"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    text = compute()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_suffix(".part")
+        partial_path.write_text(text, encoding="utf-8")
+        os.replace(partial_path, cache_path)
+    except OSError:
+        pass  # caching is best-effort
+    return text
+
+
+def load_pdf_text(pdf_path: Path) -> str:
+    # Key on path + size + mtime so large PDFs are not rehashed on every run.
+    stat = pdf_path.stat()
+    backend = "pdfium" if pdfium is not None else "pypdf"
+    cache_key = f"pdf\0{backend}\0{pdf_path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    return _cached_text(cache_key, lambda: extract_text_from_pdf(pdf_path))
+
+
+def split_text_for_tts(text: str, max_chars: int = DEFAULT_TTS_MAX_CHARS) -> list[str]:
+    clean_text = _WS_RE.sub(" ", text).strip()
     if len(clean_text) <= max_chars:
         return [clean_text]
 
-    sentences = re.split(r"(?<=[।.!?])\s+", clean_text)
+    sentences: list[str] = []
+    start = 0
+    for match in _SENT_END_RE.finditer(clean_text):
+        sentences.append(clean_text[start : match.start() + 1])
+        start = match.end()
+    sentences.append(clean_text[start:])
+    lengths = [len(sentence) for sentence in sentences]
     chunks: list[str] = []
-    current: list[str] = []
-    current_len = 0
-
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
+    start = 0
 
-        if len(sentence) > max_chars:
-            if current:
-                chunks.append(" ".join(current).strip())
-                current, current_len = [], 0
-            for idx in range(0, len(sentence), max_chars):
-                chunks.append(sentence[idx : idx + max_chars])
+    while start < len(sentences):
+        if lengths[start] > max_chars:
+            sentence = sentences[start]
+            chunks.extend(sentence[idx : idx + max_chars] for idx in range(0, lengths[start], max_chars))
+            start += 1
             continue
 
-        projected = current_len + len(sentence) + (1 if current else 0)
-        if projected > max_chars:
-            chunks.append(" ".join(current).strip())
-            current = [sentence]
-            current_len = len(sentence)
-        else:
-            current.append(sentence)
-            current_len = projected
-
-    if current:
-        chunks.append(" ".join(current).strip())
+        # Grow the window while the joined length (with separating spaces) fits.
+        end = start + 1
+        total = lengths[start]
+        while end < len(sentences) and total + 1 + lengths[end] <= max_chars:
+            total += 1 + lengths[end]
+            end += 1
+        chunks.append(" ".join(sentences[start:end]))
+        start = end
 
-    return [chunk for chunk in chunks if chunk]
+    return chunks
 
 
 def ensure_ffmpeg(binary: str) -> None:
@@ -67,99 +169,219 @@ def ensure_ffmpeg(binary: str) -> None:
         raise RuntimeError(f"{binary} is required but not installed.")
 
 
-def build_hindi_audio_from_text(text: str, output_audio: Path, lang: str = "hi") -> None:
-    chunks = split_text_for_tts(text)
+def _is_retryable_tts_error(exc: Exception) -> bool:
+    if not isinstance(exc, gTTSError):
+        return False
+    rsp = exc.rsp
+    # No response means the request itself failed (timeout, reset connection).
+    return rsp is None or rsp.status_code == 429 or rsp.status_code >= 500
+
+
+def _synth_one(chunk: str, chunk_path: Path, lang: str) -> Path:
+    partial_path = chunk_path.with_suffix(".part")
+    attempt = 1
+    while True:
+        # Small jitter keeps parallel workers from hitting Google TTS in lockstep.
+        time.sleep(random.uniform(0.2, 0.8))
+        try:
+            gTTS(text=chunk, lang=lang).save(str(partial_path))
+            os.replace(partial_path, chunk_path)
+            return chunk_path
+        except Exception as exc:
+            if _is_retryable_tts_error(exc) and attempt < TTS_MAX_ATTEMPTS:
+                time.sleep(min(30.0, 2**attempt) + random.uniform(0, 1))
+                attempt += 1
+                continue
+            raise RuntimeError(
+                "gTTS request failed while generating Hindi audio. Check internet/proxy access to Google TTS."
+            ) from exc
+
+
+def _tts_max_chars(lang: str) -> int:
+    return MAX_CHARS_BY_LANG.get(lang, DEFAULT_TTS_MAX_CHARS)
+
+
+def _tts_chunk_dir(text: str, lang: str) -> Path:
+    # Leftover chunk files are only reusable if the text is split at the same places again.
+    key = f"v{TTS_CHUNK_VERSION}\0{lang}\0{_tts_max_chars(lang)}\0{text}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+    return TTS_CACHE_DIR / digest
+
+
+def synthesize_tts_chunks(text: str, chunk_dir: Path, lang: str = "hi", workers: int = 4) -> list[Path]:
+    chunks = split_text_for_tts(text, max_chars=_tts_max_chars(lang))
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    chunk_paths = [chunk_dir / f"chunk_{idx:04d}.mp3" for idx in range(1, len(chunks) + 1)]
+
+    # Chunks left over from an interrupted run are reused instead of re-requested.
+    pending = [
+        (chunk, chunk_path)
+        for chunk, chunk_path in zip(chunks, chunk_paths)
+        if not (chunk_path.exists() and chunk_path.stat().st_size > 0)
+    ]
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as executor:
+            futures = [executor.submit(_synth_one, chunk, chunk_path, lang) for chunk, chunk_path in pending]
+            for future in as_completed(futures):
+                future.result()
+
+    return chunk_paths
+
+
+def _write_audio_concat_list(chunk_paths: list[Path], concat_list: Path) -> None:
+    lines = [f"file '{os.path.abspath(chunk_path)}'\n" for chunk_path in chunk_paths]
+    concat_list.write_text("".join(lines), encoding="utf-8")
+
+
+def build_hindi_audio_from_text(text: str, output_audio: Path, lang: str = "hi", workers: int = 4) -> None:
     output_audio.parent.mkdir(parents=True, exist_ok=True)
+    chunk_dir = _tts_chunk_dir(text, lang)
+    chunk_paths = synthesize_tts_chunks(text, chunk_dir, lang=lang, workers=workers)
+
+    if len(chunk_paths) == 1:
+        try:
+            os.replace(chunk_paths[0], output_audio)
+        except OSError:
+            # Chunk cache and output may be on different filesystems.
+            shutil.copyfile(chunk_paths[0], output_audio)
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        return
 
-    with tempfile.TemporaryDirectory(prefix="tts_chunks_") as tmp:
-        temp_dir = Path(tmp)
-        chunk_paths: list[Path] = []
-
-        for idx, chunk in enumerate(chunks, start=1):
-            chunk_path = temp_dir / f"chunk_{idx:04d}.mp3"
-            tts = gTTS(text=chunk, lang=lang)
-            try:
-                tts.save(str(chunk_path))
-            except Exception as exc:
-                raise RuntimeError(
-                    "gTTS request failed while generating Hindi audio. Check internet/proxy access to Google TTS."
-                ) from exc
-            chunk_paths.append(chunk_path)
-
-        if len(chunk_paths) == 1:
-            output_audio.write_bytes(chunk_paths[0].read_bytes())
-            return
-
-        ensure_ffmpeg("ffmpeg")
-        concat_list = temp_dir / "concat.txt"
-        with concat_list.open("w", encoding="utf-8") as handle:
-            for chunk_path in chunk_paths:
-                handle.write(f"file '{chunk_path.resolve()}'\n")
-
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            str(concat_list),
-            "-c",
-            "copy",
-            str(output_audio),
-        ]
-        subprocess.run(cmd, check=True)
+    ensure_ffmpeg("ffmpeg")
+    concat_list = chunk_dir / "concat.txt"
+    _write_audio_concat_list(chunk_paths, concat_list)
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(concat_list),
+        "-c",
+        "copy",
+        str(output_audio),
+    ]
+    subprocess.run(cmd, check=True)
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+
+
+def _download_image(session: requests.Session, image_url: str, image_path: Path) -> bool:
+    partial_path = image_path.with_name(image_path.name + ".part")
+    try:
+        with session.get(image_url, stream=True, timeout=30) as img_resp:
+            if img_resp.status_code != 200:
+                return False
+            if int(img_resp.headers.get("Content-Length") or 0) > MAX_IMAGE_BYTES:
+                return False
+
+            written = 0
+            with partial_path.open("wb") as handle:
+                for block in img_resp.iter_content(chunk_size=1024 * 1024):
+                    written += len(block)
+                    if written > MAX_IMAGE_BYTES:
+                        break
+                    handle.write(block)
+    except requests.RequestException:
+        # One failed image is skipped like a non-200 one; it must not abort the whole batch.
+        partial_path.unlink(missing_ok=True)
+        return False
+    if written > MAX_IMAGE_BYTES:
+        partial_path.unlink()
+        return False
+    os.replace(partial_path, image_path)
+    return True
+
+
+def _fetch_image(session: requests.Session, image_url: str, image_path: Path) -> bool:
+    if image_path.exists() and image_path.stat().st_size > 0:
+        return True
+    return _download_image(session, image_url, image_path)
+
+
+def _search_commons(session: requests.Session, query: str, limit: int, cache_dir: Path) -> dict:
+    params = {
+        "action": "query",
+        "generator": "search",
+        "gsrsearch": query,
+        "gsrnamespace": "6",
+        "gsrlimit": str(limit),
+        "prop": "imageinfo",
+        "iiprop": "url|mime|size",
+        # Ask for a 1280px-wide thumbnail; the video is rendered at 1280x720 anyway.
+        "iiurlwidth": "1280",
+        "format": "json",
+    }
+    key = hashlib.sha1(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+    cache_path = cache_dir / f"search_{key}.json"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < SEARCH_CACHE_TTL_SECONDS:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    search_resp = session.get("https://commons.wikimedia.org/w/api.php", params=params, timeout=30)
+    search_resp.raise_for_status()
+    pages = search_resp.json().get("query", {}).get("pages", {})
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(pages), encoding="utf-8")
+    return pages
 
 
 def fetch_related_images(query: str, output_dir: Path, count: int = 8) -> list[Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
     session = requests.Session()
-
-    search_resp = session.get(
-        "https://commons.wikimedia.org/w/api.php",
-        params={
-            "action": "query",
-            "generator": "search",
-            "gsrsearch": query,
-            "gsrnamespace": "6",
-            "gsrlimit": str(max(1, count * 2)),
-            "prop": "imageinfo",
-            "iiprop": "url",
-            "format": "json",
-        },
-        timeout=30,
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False
+        ),
     )
-    search_resp.raise_for_status()
-    pages = search_resp.json().get("query", {}).get("pages", {})
+    session.mount("https://", adapter)
 
-    images: list[Path] = []
+    pages = _search_commons(session, query, min(50, max(1, count * 4)), output_dir / ".cache")
+
+    candidates: list[tuple[str, Path]] = []
     for page in pages.values():
-        if len(images) >= count:
-            break
         image_info = (page.get("imageinfo") or [{}])[0]
-        image_url = image_info.get("url")
-        if not image_url:
+        image_url = image_info.get("thumburl") or image_info.get("url")
+        suffix = IMAGE_MIME_SUFFIXES.get(image_info.get("mime", ""))
+        if not image_url or not suffix:
             continue
 
-        suffix = Path(image_url).suffix.lower()
-        if suffix not in IMAGE_EXTENSIONS:
-            continue
+        # Name files by URL hash so repeat runs reuse earlier downloads.
+        image_name = hashlib.sha1(image_url.encode("utf-8")).hexdigest()[:16] + suffix
+        candidates.append((image_url, output_dir / image_name))
 
-        image_name = page.get("title", "image").replace("File:", "").replace(" ", "_")
-        image_path = output_dir / image_name
-        img_resp = session.get(image_url, timeout=30)
-        if img_resp.status_code != 200:
-            continue
-        image_path.write_bytes(img_resp.content)
-        images.append(image_path)
+    images: list[Path] = []
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        while candidates and len(images) < count:
+            batch, candidates = candidates[: count - len(images)], candidates[count - len(images) :]
+            results = executor.map(lambda pair: _fetch_image(session, *pair), batch)
+            images.extend(image_path for (_, image_path), ok in zip(batch, results) if ok)
 
     if not images:
         raise RuntimeError("Could not download related images from Wikimedia Commons.")
     return images
 
 
+def _header_duration_seconds(audio_path: Path) -> float | None:
+    if mutagen is None:
+        return None
+    try:
+        audio = mutagen.File(str(audio_path))
+    except mutagen.MutagenError:
+        return None
+    if audio is None or not audio.info.length:
+        return None
+    return float(audio.info.length)
+
+
 def get_audio_duration_seconds(audio_path: Path) -> float:
+    duration = _header_duration_seconds(audio_path)
+    if duration is not None:
+        return duration
+
     ensure_ffmpeg("ffprobe")
     cmd = [
         "ffprobe",
@@ -175,102 +397,222 @@ def get_audio_duration_seconds(audio_path: Path) -> float:
     return float(result.stdout.strip())
 
 
-def create_video_from_audio_and_images(audio_path: Path, image_paths: Iterable[Path], output_video: Path) -> None:
-    ensure_ffmpeg("ffmpeg")
-    image_list = list(image_paths)
-    if not image_list:
-        raise ValueError("No images provided for video generation.")
+def _video_encoder_args(video_codec: str) -> list[str]:
+    if video_codec == "libx264":
+        # Frames only change every few seconds, so x264's search effort is wasted.
+        return ["-c:v", "libx264", "-preset", "veryfast", "-tune", "stillimage", "-threads", "0", "-pix_fmt", "yuv420p"]
+    if video_codec == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-pix_fmt", "yuv420p"]
+    if video_codec == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-pix_fmt", "yuv420p"]
+    if video_codec == "h264_vaapi":
+        return ["-c:v", "h264_vaapi"]
+    raise ValueError(f"Unsupported video codec: {video_codec}")
+
+
+def _slideshow_filter_graph(image_list: list[Path], image_duration: float, post_filter: str) -> tuple[list[str], str]:
+    input_args: list[str] = []
+    for image in image_list:
+        input_args += ["-framerate", str(SLIDESHOW_FPS), "-i", str(image)]
+
+    # Each image is decoded and scaled once; the loop filter then repeats the finished frame.
+    # Round up: a slideshow shorter than the audio would let -shortest cut the narration.
+    frame_count = max(1, math.ceil(image_duration * SLIDESHOW_FPS))
+    scaled = "".join(
+        f"[{idx}:v]{VIDEO_SCALE_FILTER},setsar=1,format=yuv420p,"
+        f"loop=loop={frame_count - 1}:size=1,setpts=N/{SLIDESHOW_FPS}/TB[v{idx}];"
+        for idx in range(len(image_list))
+    )
+    labels = "".join(f"[v{idx}]" for idx in range(len(image_list)))
+    return input_args, f"{scaled}{labels}concat=n={len(image_list)}:v=1:a=0{post_filter}[v]"
 
-    duration = get_audio_duration_seconds(audio_path)
+
+def _render_video(
+    audio_input: list[str],
+    duration: float,
+    image_list: list[Path],
+    output_video: Path,
+    video_codec: str,
+) -> None:
     image_duration = max(3.0, duration / len(image_list))
     output_video.parent.mkdir(parents=True, exist_ok=True)
 
-    concat_file = output_video.parent / f"{output_video.stem}_images.txt"
-    with concat_file.open("w", encoding="utf-8") as handle:
-        for image in image_list:
-            handle.write(f"file '{image.resolve()}'\n")
-            handle.write(f"duration {image_duration:.2f}\n")
-        handle.write(f"file '{image_list[-1].resolve()}'\n")
+    post_filter = ""
+    hw_device_args: list[str] = []
+    if video_codec == "h264_vaapi":
+        hw_device_args = ["-vaapi_device", "/dev/dri/renderD128"]
+        post_filter = ",format=nv12,hwupload"
+
+    if len(image_list) <= MAX_FILTER_GRAPH_IMAGES:
+        image_args, filter_graph = _slideshow_filter_graph(image_list, image_duration, post_filter)
+        video_args = ["-filter_complex", filter_graph, "-map", "[v]", "-map", f"{len(image_list)}:a"]
+    else:
+        concat_file = output_video.parent / f"{output_video.stem}_images.txt"
+        absolute_paths = [os.path.abspath(image) for image in image_list]
+        lines = [f"file '{path}'\nduration {image_duration:.2f}\n" for path in absolute_paths]
+        lines.append(f"file '{absolute_paths[-1]}'\n")
+        concat_file.write_text("".join(lines), encoding="utf-8")
+        image_args = ["-f", "concat", "-safe", "0", "-i", str(concat_file)]
+        video_args = ["-vf", VIDEO_SCALE_FILTER + post_filter]
 
     cmd = [
         "ffmpeg",
         "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(concat_file),
-        "-i",
-        str(audio_path),
-        "-c:v",
-        "libx264",
-        "-pix_fmt",
-        "yuv420p",
-        "-vf",
-        "scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2",
+        *hw_device_args,
+        *image_args,
+        *audio_input,
+        *video_args,
+        *_video_encoder_args(video_codec),
+        "-r",
+        str(SLIDESHOW_FPS),
         "-c:a",
         "aac",
+        "-b:a",
+        "128k",
         "-shortest",
         str(output_video),
     ]
     subprocess.run(cmd, check=True)
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Stage-wise automation: create Hindi audio from PDF first, and video from audio later."
+def create_video_from_audio_and_images(
+    audio_path: Path,
+    image_paths: Iterable[Path],
+    output_video: Path,
+    video_codec: str = "libx264",
+) -> None:
+    ensure_ffmpeg("ffmpeg")
+    image_list = list(image_paths)
+    if not image_list:
+        raise ValueError("No images provided for video generation.")
+
+    duration = get_audio_duration_seconds(audio_path)
+    _render_video(["-i", str(audio_path)], duration, image_list, output_video, video_codec)
+
+
+def build_hindi_video_from_text(
+    text: str,
+    image_paths: Iterable[Path],
+    output_video: Path,
+    lang: str = "hi",
+    workers: int = 4,
+    video_codec: str = "libx264",
+) -> None:
+    ensure_ffmpeg("ffmpeg")
+    image_list = list(image_paths)
+    if not image_list:
+        raise ValueError("No images provided for video generation.")
+
+    chunk_dir = _tts_chunk_dir(text, lang)
+    chunk_paths = synthesize_tts_chunks(text, chunk_dir, lang=lang, workers=workers)
+    concat_list = chunk_dir / "concat.txt"
+    _write_audio_concat_list(chunk_paths, concat_list)
+
+    # ffprobe reports no duration for a concat list, so each chunk is measured on its own.
+    duration = sum(get_audio_duration_seconds(chunk_path) for chunk_path in chunk_paths)
+    audio_input = ["-f", "concat", "-safe", "0", "-i", str(concat_list)]
+    _render_video(audio_input, duration, image_list, output_video, video_codec)
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+
+
+def _add_tts_args(cmd: argparse.ArgumentParser) -> None:
+    cmd.add_argument("--pdf", type=Path, required=True, help="Input PDF path")
+    cmd.add_argument("--lang", default="hi", help="TTS language code, default=hi")
+    cmd.add_argument(
+        "--tts-workers",
+        type=int,
+        default=4,
+        help="Number of parallel gTTS requests, default=4",
     )
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    audio_cmd = subparsers.add_parser("audio", help="Create Hindi MP3 from a PDF")
-    audio_cmd.add_argument("--pdf", type=Path, required=True, help="Input PDF path")
-    audio_cmd.add_argument("--audio-output", type=Path, required=True, help="Output MP3 path")
-    audio_cmd.add_argument("--lang", default="hi", help="TTS language code, default=hi")
 
-    video_cmd = subparsers.add_parser("video", help="Create MP4 from existing audio and related images")
-    video_cmd.add_argument("--audio", type=Path, required=True, help="Input MP3 path")
-    video_cmd.add_argument("--video-output", type=Path, required=True, help="Output MP4 path")
-    video_cmd.add_argument(
+def _add_video_args(cmd: argparse.ArgumentParser) -> None:
+    cmd.add_argument("--video-output", type=Path, required=True, help="Output MP4 path")
+    cmd.add_argument(
         "--images-dir",
         type=Path,
         help="Use images from this folder (jpg/png/webp). If omitted, images are auto-downloaded.",
     )
-    video_cmd.add_argument(
+    cmd.add_argument(
         "--query",
         default="belief effect placebo psychology",
         help="Search query for automatic image download",
     )
-    video_cmd.add_argument(
+    cmd.add_argument(
         "--auto-images-count",
         type=int,
         default=8,
         help="Number of images to auto-download when --images-dir is not provided",
     )
+    cmd.add_argument(
+        "--video-codec",
+        default="libx264",
+        choices=VIDEO_CODECS,
+        help="H.264 encoder; use h264_nvenc/h264_videotoolbox/h264_vaapi for hardware encoding",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Stage-wise automation: create Hindi audio from PDF first, and video from audio later."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    audio_cmd = subparsers.add_parser("audio", help="Create Hindi MP3 from a PDF")
+    _add_tts_args(audio_cmd)
+    audio_cmd.add_argument("--audio-output", type=Path, required=True, help="Output MP3 path")
+
+    video_cmd = subparsers.add_parser("video", help="Create MP4 from existing audio and related images")
+    video_cmd.add_argument("--audio", type=Path, required=True, help="Input MP3 path")
+    _add_video_args(video_cmd)
+
+    combined_cmd = subparsers.add_parser(
+        "combined", help="Create MP4 directly from a PDF without writing an intermediate MP3"
+    )
+    _add_tts_args(combined_cmd)
+    _add_video_args(combined_cmd)
 
     return parser.parse_args()
 
 
+def _resolve_images(args: argparse.Namespace) -> list[Path]:
+    if args.images_dir:
+        suffixes = tuple(IMAGE_EXTENSIONS)
+        with os.scandir(args.images_dir) as entries:
+            image_paths = sorted(
+                Path(entry.path) for entry in entries if entry.name.lower().endswith(suffixes) and entry.is_file()
+            )
+        if not image_paths:
+            raise ValueError(f"No supported images found in {args.images_dir}")
+        return image_paths
+    return fetch_related_images(query=args.query, output_dir=Path("output/auto_images"), count=args.auto_images_count)
+
+
 def main() -> None:
     args = parse_args()
 
     if args.command == "audio":
-        text = extract_text_from_pdf(args.pdf)
-        build_hindi_audio_from_text(text=text, output_audio=args.audio_output, lang=args.lang)
+        text = load_pdf_text(args.pdf)
+        build_hindi_audio_from_text(
+            text=text, output_audio=args.audio_output, lang=args.lang, workers=args.tts_workers
+        )
         return
 
-    if args.images_dir:
-        image_paths = [
-            p
-            for p in sorted(args.images_dir.iterdir())
-            if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
-        ]
-        if not image_paths:
-            raise ValueError(f"No supported images found in {args.images_dir}")
-    else:
-        image_paths = fetch_related_images(query=args.query, output_dir=Path("output/auto_images"), count=args.auto_images_count)
+    image_paths = _resolve_images(args)
+
+    if args.command == "combined":
+        text = load_pdf_text(args.pdf)
+        build_hindi_video_from_text(
+            text=text,
+            image_paths=image_paths,
+            output_video=args.video_output,
+            lang=args.lang,
+            workers=args.tts_workers,
+            video_codec=args.video_codec,
+        )
+        return
 
-    create_video_from_audio_and_images(args.audio, image_paths, args.video_output)
+    create_video_from_audio_and_images(args.audio, image_paths, args.video_output, video_codec=args.video_codec)
 
 
 if __name__ == "__main__":
@@ -1,40 +1,66 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import heapq
+import io
+import itertools
+import math
+import mmap
+import os
 import re
 import shutil
 import subprocess
+import tempfile
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
-
-STOPWORDS = {
-    "और",
-    "है",
-    "हैं",
-    "था",
-    "थी",
-    "थे",
-    "को",
-    "के",
-    "का",
-    "की",
-    "में",
-    "से",
-    "पर",
-    "यह",
-    "वह",
-    "तो",
-    "भी",
-    "एक",
-    "कि",
-    "या",
-    "लिए",
-    "तक",
-}
+from typing import Callable, Iterable, Iterator
+
+STOPWORDS = frozenset(
+    {
+        "और",
+        "है",
+        "हैं",
+        "था",
+        "थी",
+        "थे",
+        "को",
+        "के",
+        "का",
+        "की",
+        "में",
+        "से",
+        "पर",
+        "यह",
+        "वह",
+        "तो",
+        "भी",
+        "एक",
+        "कि",
+        "या",
+        "लिए",
+        "तक",
+    }
+)
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+TEXT_CACHE_DIR = Path.home() / ".cache" / "hindi_audiobook"
+# Bump whenever extraction or summarization output changes, so stale cache entries are ignored.
+CACHE_VERSION = 2
+PARALLEL_SUMMARY_MIN_CHARS = 2_000_000
+PARALLEL_PDF_MIN_PAGES = 16
+STREAM_PDF_MIN_BYTES = 50 * 1024 * 1024
+MAX_FILTER_GRAPH_IMAGES = 64
+SLIDESHOW_FPS = 5
+VIDEO_SCALE_FILTER = "scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2"
+
+_CHAPTER_RE = re.compile(r"^(अध्याय\s*\d+.*|Chapter\s*\d+.*)$", flags=re.MULTILINE | re.IGNORECASE)
+# Matches the gap after a terminator; split_sentences slices around it.
+_SENT_END_RE = re.compile(r"[।.!?]\s+")
+_TOKEN_RE = re.compile(r"[\u0900-\u097Fa-zA-Z]+")
 
 
 @dataclass
@@ -43,105 +69,216 @@ class Section:
     content: str
 
 
-def split_sections(text: str) -> list[Section]:
-    pattern = re.compile(r"^(अध्याय\s*\d+.*|Chapter\s*\d+.*)$", flags=re.MULTILINE | re.IGNORECASE)
-    matches = list(pattern.finditer(text))
-
-    if not matches:
-        return [Section(title="संपूर्ण पुस्तक", content=text.strip())]
+def iter_sections(pages: Iterable[str]) -> Iterator[Section]:
+    title: str | None = None
+    parts: list[str] = []
+    carry: str | None = None
+    for page in pages:
+        # Only the new page plus the carried-over last line is scanned, never the whole chapter.
+        window = page if carry is None else f"{carry}\n{page}"
+        pos = 0
+        for match in _CHAPTER_RE.finditer(window):
+            parts.append(window[pos : match.start()])
+            if title is not None:
+                body = "".join(parts).strip()
+                if body:
+                    yield Section(title=title, content=body)
+            title = match.group(1).strip()
+            parts = []
+            pos = match.end()
+
+        # A heading can only run onto the next page from the last non-blank line, since the
+        # `\s*` between keyword and number may span line breaks; that line is carried over.
+        rest = window[pos:]
+        cut = rest.rstrip().rfind("\n") + 1 if rest.strip() else len(rest)
+        parts.append(rest[:cut])
+        carry = rest[cut:]
+
+    if carry is not None:
+        parts.append(carry)
+    body = "".join(parts).strip()
+    if title is None:
+        yield Section(title="संपूर्ण पुस्तक", content=body)
+    elif body:
+        yield Section(title=title, content=body)
 
-    sections: list[Section] = []
-    for idx, match in enumerate(matches):
-        start = match.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
-        title = match.group(1).strip()
-        body = text[start:end].strip()
-        if body:
-            sections.append(Section(title=title, content=body))
 
-    return sections or [Section(title="संपूर्ण पुस्तक", content=text.strip())]
+def split_sections(text: str) -> list[Section]:
+    return list(iter_sections([text])) or [Section(title="संपूर्ण पुस्तक", content=text.strip())]
 
 
 def split_sentences(text: str) -> list[str]:
-    chunks = re.split(r"(?<=[।.!?])\s+", text.strip())
+    text = text.strip()
+    chunks: list[str] = []
+    start = 0
+    for match in _SENT_END_RE.finditer(text):
+        chunks.append(text[start : match.start() + 1])
+        start = match.end()
+    chunks.append(text[start:])
     return [c.strip() for c in chunks if c.strip()]
 
 
 def tokenize(sentence: str) -> list[str]:
-    tokens = re.findall(r"[\u0900-\u097Fa-zA-Z]+", sentence.lower())
+    tokens = _TOKEN_RE.findall(sentence.lower())
     return [t for t in tokens if t not in STOPWORDS and len(t) > 1]
 
 
-def score_sentences(sentences: Iterable[str]) -> list[tuple[str, float]]:
+def score_sentences(sentences: Iterable[str]) -> list[float]:
     sentence_list = list(sentences)
-    words: list[str] = []
-    for sentence in sentence_list:
-        words.extend(tokenize(sentence))
-
     if not sentence_list:
         return []
 
-    freqs = Counter(words)
+    token_lists = [tokenize(sentence) for sentence in sentence_list]
+    freqs = Counter(itertools.chain.from_iterable(token_lists))
     if not freqs:
-        return [(s, 0.0) for s in sentence_list]
+        return [0.0] * len(sentence_list)
 
     max_freq = max(freqs.values())
     weighted = {word: value / max_freq for word, value in freqs.items()}
 
-    scores: list[tuple[str, float]] = []
-    for sentence in sentence_list:
-        token_list = tokenize(sentence)
+    weight_of = weighted.__getitem__
+    return [sum(map(weight_of, token_list)) / len(token_list) if token_list else 0.0 for token_list in token_lists]
+
+
+def score_sentences_tfidf(sentences: Iterable[str]) -> list[float]:
+    token_lists = [tokenize(sentence) for sentence in sentences]
+    if not token_lists:
+        return []
+
+    # Each sentence is a mini-document; smoothed idf as in scikit-learn's TfidfVectorizer.
+    doc_freqs = Counter(itertools.chain.from_iterable(set(token_list) for token_list in token_lists))
+    doc_count = len(token_lists)
+    idf = {word: math.log((1 + doc_count) / (1 + df)) + 1 for word, df in doc_freqs.items()}
+
+    scores: list[float] = []
+    for token_list in token_lists:
         if not token_list:
-            scores.append((sentence, 0.0))
+            scores.append(0.0)
             continue
-        score = sum(weighted[t] for t in token_list) / len(token_list)
-        scores.append((sentence, score))
-
+        term_freqs = Counter(token_list)
+        scores.append(sum(idf[word] * tf for word, tf in term_freqs.items()) / len(term_freqs))
     return scores
 
 
-def summarize_text(text: str, ratio: float = 0.3, min_sentences: int = 2) -> str:
+SCORERS = {"tf": score_sentences, "tfidf": score_sentences_tfidf}
+
+
+def summarize_text(text: str, ratio: float = 0.3, min_sentences: int = 2, scoring: str = "tf") -> str:
     sentences = split_sentences(text)
     if len(sentences) <= min_sentences:
         return " ".join(sentences)
 
-    scored = score_sentences(sentences)
+    scores = SCORERS[scoring](sentences)
     keep_count = max(min_sentences, int(len(sentences) * ratio))
 
-    top_sentences = set(s for s, _ in sorted(scored, key=lambda x: x[1], reverse=True)[:keep_count])
-    ordered_summary = [s for s in sentences if s in top_sentences]
-    return " ".join(ordered_summary)
+    top_idx = heapq.nlargest(keep_count, range(len(sentences)), key=scores.__getitem__)
+    return " ".join(sentences[i] for i in sorted(top_idx))
+
 
+def summarize_sections(sections: list[Section], ratio: float, scoring: str = "tf") -> str:
+    contents = [section.content for section in sections]
+    summarize = functools.partial(summarize_text, ratio=ratio, scoring=scoring)
+    workers = min(os.cpu_count() or 1, len(sections))
 
-def summarize_sections(sections: list[Section], ratio: float) -> str:
-    output_lines: list[str] = []
-    for section in sections:
-        summary = summarize_text(section.content, ratio=ratio)
-        output_lines.append(f"{section.title}\n{summary}\n")
+    # Worker start-up only pays off once there is enough text to spread across cores.
+    if workers > 1 and len(sections) > 2 and sum(map(len, contents)) >= PARALLEL_SUMMARY_MIN_CHARS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(summarize, contents))
+    else:
+        summaries = [summarize(content) for content in contents]
+
+    output_lines = [f"{section.title}\n{summary}\n" for section, summary in zip(sections, summaries)]
     return "\n".join(output_lines).strip()
 
 
-def extract_pdf_text(pdf_path: Path) -> str:
+_PDF_READERS: dict[str, object] = {}
+
+
+def _open_pdf_reader(pdf_path: str):
     try:
         from pypdf import PdfReader
     except ImportError as exc:
         raise RuntimeError("pypdf is required for PDF input. Install it with: pip install pypdf") from exc
 
-    reader = PdfReader(str(pdf_path))
-    pages = [page.extract_text() or "" for page in reader.pages]
+    # Given a path, pypdf copies the whole file into a BytesIO; a read-only mmap lets
+    # every worker share the OS page cache instead. The reader keeps the map alive.
+    with open(pdf_path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ValueError(f"No extractable text found in PDF: {pdf_path}")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return PdfReader(mapped, strict=False)
+
+
+def _extract_one_page(pdf_path: str, page_idx: int) -> str:
+    reader = _PDF_READERS.get(pdf_path)
+    if reader is None:
+        reader = _PDF_READERS[pdf_path] = _open_pdf_reader(pdf_path)
+    return reader.pages[page_idx].extract_text() or ""
+
+
+def extract_pdf_text(pdf_path: Path) -> str:
+    reader = _open_pdf_reader(str(pdf_path))
+    page_count = len(reader.pages)
+    workers = min(os.cpu_count() or 1, 8)
+    if workers > 1 and page_count >= PARALLEL_PDF_MIN_PAGES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(_extract_one_page, [str(pdf_path)] * page_count, range(page_count), chunksize=4))
+    else:
+        pages = [page.extract_text() or "" for page in reader.pages]
     text = "\n".join(pages).strip()
     if not text:
         raise ValueError(f"No extractable text found in PDF: {pdf_path}")
     return text
 
 
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
+    reader = _open_pdf_reader(str(pdf_path))
+    page_count = len(reader.pages)
+    workers = min(os.cpu_count() or 1, 8)
+    if workers > 1 and page_count >= PARALLEL_PDF_MIN_PAGES:
+        # Pages still arrive in order, so callers can consume them while later ones are extracted.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(_extract_one_page, [str(pdf_path)] * page_count, range(page_count), chunksize=4)
+        return
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def _summarize_pdf_stream(pdf_path: Path, ratio: float, scoring: str) -> str:
+    # Pages flow straight into sections, so the joined text of a huge book is never built.
+    sections = [section for section in iter_sections(iter_pdf_pages(pdf_path)) if section.content]
+    if not sections:
+        raise ValueError(f"No extractable text found in PDF: {pdf_path}")
+    return summarize_sections(sections, ratio=ratio, scoring=scoring)
+
+
+def _cached_text(cache_key: str, compute: Callable[[], str]) -> str:
+    versioned_key = f"v{CACHE_VERSION}\0{cache_key}"
+    cache_path = TEXT_CACHE_DIR / f"{hashlib.sha256(versioned_key.encode('utf-8')).hexdigest()}.txt"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    text = compute()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_suffix(".part")
+        partial_path.write_text(text, encoding="utf-8")
+        os.replace(partial_path, cache_path)
+    except OSError:
+        pass  # caching is best-effort
+    return text
+
+
 def read_source_text(input_path: Path) -> str:
     if input_path.suffix.lower() == ".pdf":
-        return extract_pdf_text(input_path)
+        # Keyed on the file stat rather than its contents, so a large PDF is never read just to look it up.
+        stat = input_path.stat()
+        cache_key = f"source\0{input_path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        return _cached_text(cache_key, lambda: extract_pdf_text(input_path))
     return input_path.read_text(encoding="utf-8")
 
 
-def create_audio(summary_text: str, output_path: Path) -> None:
+def synthesize_audio(summary_text: str, workers: int = 8) -> list[bytes]:
     try:
         from gtts import gTTS
     except ImportError as exc:
@@ -149,15 +286,50 @@ def create_audio(summary_text: str, output_path: Path) -> None:
             "gTTS is required for audio output. Install it with: pip install gTTS"
         ) from exc
 
+    # One request per chapter block; requests overlap instead of running back to back.
+    blocks = [block.strip() for block in summary_text.split("\n\n") if block.strip()] or [summary_text]
+
+    def synthesize(block: str) -> bytes:
+        buffer = io.BytesIO()
+        gTTS(text=block, lang="hi").write_to_fp(buffer)
+        return buffer.getvalue()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(blocks)))) as executor:
+        return list(executor.map(synthesize, blocks))
+
+
+def create_audio(summary_text: str, output_path: Path, workers: int = 8) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    tts = gTTS(text=summary_text, lang="hi")
-    tts.save(str(output_path))
+    # MP3 is frame-based, so the parts can be appended directly; gTTS joins its own requests the same way.
+    output_path.write_bytes(b"".join(synthesize_audio(summary_text, workers=workers)))
 
 
-def get_audio_duration_seconds(audio_path: Path) -> float:
+def get_audio_duration_seconds(audio: Path | bytes) -> float:
+    try:
+        import mutagen
+    except ImportError:
+        mutagen = None
+
+    in_memory = isinstance(audio, bytes)
+    # mutagen reads the duration from the file headers, avoiding an ffprobe process.
+    if mutagen is not None:
+        try:
+            info = mutagen.File(io.BytesIO(audio) if in_memory else str(audio))
+        except mutagen.MutagenError:
+            info = None
+        if info is not None and info.info.length:
+            return float(info.info.length)
+
     if shutil.which("ffprobe") is None:
         raise RuntimeError("ffprobe is required for video generation. Please install ffmpeg.")
 
+    if in_memory:
+        # ffprobe reports no duration for MP3 read from stdin, so probe a temporary file instead.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            audio_path = Path(tmp_dir) / "audio.mp3"
+            audio_path.write_bytes(audio)
+            return get_audio_duration_seconds(audio_path)
+
     cmd = [
         "ffprobe",
         "-v",
@@ -166,66 +338,115 @@ def get_audio_duration_seconds(audio_path: Path) -> float:
         "format=duration",
         "-of",
         "default=noprint_wrappers=1:nokey=1",
-        str(audio_path),
+        str(audio),
     ]
     result = subprocess.run(cmd, check=True, capture_output=True, text=True)
     return float(result.stdout.strip())
 
 
 def pick_related_images(summary_text: str, images_dir: Path, max_images: int = 12) -> list[Path]:
-    candidates = [p for p in images_dir.iterdir() if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS]
+    suffixes = tuple(IMAGE_EXTENSIONS)
+    with os.scandir(images_dir) as entries:
+        candidates = [
+            Path(entry.path) for entry in entries if entry.name.lower().endswith(suffixes) and entry.is_file()
+        ]
     if not candidates:
         raise ValueError(f"No images found in {images_dir}. Add jpg/png/webp images for video generation.")
 
-    keywords = set(tokenize(summary_text))
-    scored: list[tuple[Path, int]] = []
-    for image in candidates:
-        name_tokens = set(tokenize(image.stem.replace("_", " ").replace("-", " ")))
-        overlap = len(name_tokens & keywords)
-        scored.append((image, overlap))
+    keywords = frozenset(tokenize(summary_text))
+    # "_" and "-" are not token characters, so tokenize already splits file stems on them.
+    # intersection builds one small result set per image; counting through dict.fromkeys was slower.
+    overlaps = [len(keywords.intersection(tokenize(image.stem))) for image in candidates]
+    top_idx = heapq.nlargest(max_images, range(len(candidates)), key=overlaps.__getitem__)
+    return [candidates[i] for i in top_idx]
+
 
-    ranked = [path for path, _ in sorted(scored, key=lambda item: item[1], reverse=True)]
-    return ranked[:max_images]
+@functools.lru_cache(maxsize=None)
+def _nvenc_available() -> bool:
+    # `ffmpeg -encoders` lists h264_nvenc on builds without a GPU, so try a tiny encode instead.
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=black:s=256x256:d=0.1",
+        "-c:v",
+        "h264_nvenc",
+        "-f",
+        "null",
+        "-",
+    ]
+    return subprocess.run(cmd, capture_output=True, check=False).returncode == 0
 
 
-def create_video_from_audio(audio_path: Path, images: list[Path], output_path: Path) -> None:
+def _video_encoder_args() -> list[str]:
+    if _nvenc_available():
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23"]
+    return ["-c:v", "libx264", "-preset", "veryfast", "-tune", "stillimage"]
+
+
+def _slideshow_filter_graph(images: list[Path], seconds_per_image: float) -> tuple[list[str], str]:
+    input_args: list[str] = []
+    for image in images:
+        input_args += ["-framerate", str(SLIDESHOW_FPS), "-i", str(image)]
+
+    frame_count = max(1, math.ceil(seconds_per_image * SLIDESHOW_FPS))
+    scaled = "".join(
+        f"[{idx}:v]{VIDEO_SCALE_FILTER},setsar=1,format=yuv420p,"
+        f"loop=loop={frame_count - 1}:size=1,setpts=N/{SLIDESHOW_FPS}/TB[v{idx}];"
+        for idx in range(len(images))
+    )
+    labels = "".join(f"[v{idx}]" for idx in range(len(images)))
+    return input_args, f"{scaled}{labels}concat=n={len(images)}:v=1:a=0[v]"
+
+
+def create_video_from_audio(
+    audio: Path | bytes, images: list[Path], output_path: Path, duration: float | None = None
+) -> None:
     if shutil.which("ffmpeg") is None:
         raise RuntimeError("ffmpeg is required for video generation. Please install ffmpeg.")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    duration = get_audio_duration_seconds(audio_path)
+    if duration is None:
+        duration = get_audio_duration_seconds(audio)
+    # `audio` is an MP3 path, or MP3 bytes that ffmpeg reads from stdin.
+    in_memory = isinstance(audio, bytes)
+    audio_args = ["-f", "mp3", "-i", "pipe:0"] if in_memory else ["-i", str(audio)]
     seconds_per_image = max(3.0, duration / max(1, len(images)))
 
-    concat_file = output_path.parent / f"{output_path.stem}_images.txt"
-    with concat_file.open("w", encoding="utf-8") as handle:
-        for image in images:
-            handle.write(f"file '{image.resolve()}'\n")
-            handle.write(f"duration {seconds_per_image:.2f}\n")
-        handle.write(f"file '{images[-1].resolve()}'\n")
+    if len(images) <= MAX_FILTER_GRAPH_IMAGES:
+        # One ffmpeg input per image; past the limit a concat manifest keeps the command short.
+        image_args, filter_graph = _slideshow_filter_graph(images, seconds_per_image)
+        video_args = ["-filter_complex", filter_graph, "-map", "[v]", "-map", f"{len(images)}:a"]
+    else:
+        concat_file = output_path.parent / f"{output_path.stem}_images.txt"
+        absolute_paths = [os.path.abspath(image) for image in images]
+        lines = [f"file '{path}'\nduration {seconds_per_image:.2f}\n" for path in absolute_paths]
+        lines.append(f"file '{absolute_paths[-1]}'\n")
+        concat_file.write_text("".join(lines), encoding="utf-8")
+        image_args = ["-f", "concat", "-safe", "0", "-i", str(concat_file)]
+        video_args = ["-vf", VIDEO_SCALE_FILTER]
 
     cmd = [
         "ffmpeg",
         "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(concat_file),
-        "-i",
-        str(audio_path),
-        "-c:v",
-        "libx264",
+        *image_args,
+        *audio_args,
+        *video_args,
+        *_video_encoder_args(),
+        "-r",
+        str(SLIDESHOW_FPS),
         "-pix_fmt",
         "yuv420p",
-        "-vf",
-        "scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2",
         "-c:a",
         "aac",
         "-shortest",
         str(output_path),
     ]
-    subprocess.run(cmd, check=True)
+    subprocess.run(cmd, check=True, input=audio if in_memory else None)
 
 
 def parse_args() -> argparse.Namespace:
@@ -236,6 +457,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--video-output", type=Path, help="Optional output mp4 path generated from audio + images")
     parser.add_argument("--images-dir", type=Path, help="Folder containing related images for video")
     parser.add_argument("--ratio", type=float, default=0.3, help="Summary ratio (0.1 to 0.9)")
+    parser.add_argument(
+        "--scoring",
+        choices=sorted(SCORERS),
+        default="tf",
+        help="Sentence scoring: tf (corpus frequency) or tfidf (favors distinctive sentences)",
+    )
     return parser.parse_args()
 
 
@@ -245,25 +472,52 @@ def main() -> None:
     if not (0.1 <= args.ratio <= 0.9):
         raise ValueError("--ratio must be between 0.1 and 0.9")
 
-    if args.video_output and not args.audio_output:
-        raise ValueError("--video-output requires --audio-output")
-
     if args.video_output and not args.images_dir:
         raise ValueError("--video-output requires --images-dir")
 
-    source_text = read_source_text(args.input)
-    sections = split_sections(source_text)
-    summary = summarize_sections(sections, ratio=args.ratio)
+    stat = args.input.stat()
+    if args.input.suffix.lower() == ".pdf" and stat.st_size >= STREAM_PDF_MIN_BYTES:
+        summary = _cached_text(
+            f"summary\0{args.scoring}\0{args.ratio}\0{args.input.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}",
+            lambda: _summarize_pdf_stream(args.input, ratio=args.ratio, scoring=args.scoring),
+        )
+    else:
+        source_text = read_source_text(args.input)
+        source_digest = hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+        summary = _cached_text(
+            f"summary\0{args.scoring}\0{args.ratio}\0{source_digest}",
+            lambda: summarize_sections(split_sections(source_text), ratio=args.ratio, scoring=args.scoring),
+        )
 
     args.summary_output.parent.mkdir(parents=True, exist_ok=True)
     args.summary_output.write_text(summary, encoding="utf-8")
 
-    if args.audio_output:
-        create_audio(summary, args.audio_output)
+    if not (args.audio_output or args.video_output):
+        return
 
     if args.video_output:
+        # Fail on a bad --images-dir or missing ffmpeg before spending time on gTTS.
         images = pick_related_images(summary, args.images_dir)
-        create_video_from_audio(args.audio_output, images, args.video_output)
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError("ffmpeg is required for video generation. Please install ffmpeg.")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # gTTS waits on the network, so the NVENC probe encode runs alongside it.
+        audio_future = executor.submit(synthesize_audio, summary)
+        if args.video_output:
+            _nvenc_available()
+        parts = audio_future.result()
+    audio = b"".join(parts)
+
+    if args.audio_output:
+        args.audio_output.parent.mkdir(parents=True, exist_ok=True)
+        args.audio_output.write_bytes(audio)
+
+    if args.video_output:
+        # Each part is measured on its own: the joined MP3 keeps only the first part's Xing header,
+        # so its reported length would let -shortest cut off the later chapters.
+        duration = sum(map(get_audio_duration_seconds, parts))
+        create_video_from_audio(audio, images, args.video_output, duration=duration)
 
 
 if __name__ == "__main__":
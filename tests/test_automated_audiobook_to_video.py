@@ -0,0 +1,148 @@
+from pathlib import Path
+
+import pytest
+
+import automated_audiobook_to_video as pipeline
+from automated_audiobook_to_video import split_text_for_tts
+
+
+def test_split_text_for_tts_short_text_is_single_chunk() -> None:
+    assert split_text_for_tts("यह   छोटा\nवाक्य है।", max_chars=100) == ["यह छोटा वाक्य है।"]
+
+
+def test_split_text_for_tts_respects_sentence_boundaries() -> None:
+    text = "पहला वाक्य है। दूसरा वाक्य है। तीसरा वाक्य है।"
+
+    chunks = split_text_for_tts(text, max_chars=30)
+
+    assert chunks == ["पहला वाक्य है। दूसरा वाक्य है।", "तीसरा वाक्य है।"]
+    assert all(len(chunk) <= 30 for chunk in chunks)
+
+
+def test_split_text_for_tts_slices_oversized_sentence() -> None:
+    text = "छोटा। " + "क" * 25 + "। अंत।"
+
+    chunks = split_text_for_tts(text, max_chars=10)
+
+    assert chunks[0] == "छोटा।"
+    assert "".join(chunks[1:-1]) == "क" * 25 + "।"
+    assert chunks[-1] == "अंत।"
+
+
+def test_synthesize_tts_chunks_skips_existing_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: list[str] = []
+
+    class FakeTTS:
+        def __init__(self, text: str, lang: str) -> None:
+            self.text = text
+
+        def save(self, path: str) -> None:
+            requested.append(self.text)
+            Path(path).write_bytes(b"mp3")
+
+    monkeypatch.setattr(pipeline, "gTTS", FakeTTS)
+    monkeypatch.setattr(pipeline.time, "sleep", lambda _seconds: None)
+    monkeypatch.setitem(pipeline.MAX_CHARS_BY_LANG, "hi", 20)
+    (tmp_path / "chunk_0001.mp3").write_bytes(b"done")
+
+    chunk_paths = pipeline.synthesize_tts_chunks("पहला वाक्य है। दूसरा वाक्य है।", tmp_path, lang="hi")
+
+    assert [p.name for p in chunk_paths] == ["chunk_0001.mp3", "chunk_0002.mp3"]
+    assert requested == ["दूसरा वाक्य है।"]
+    assert (tmp_path / "chunk_0001.mp3").read_bytes() == b"done"
+
+
+def test_slideshow_filter_graph_appends_post_filter_after_concat() -> None:
+    input_args, filter_graph = pipeline._slideshow_filter_graph(
+        [Path("a.jpg"), Path("b.jpg"), Path("c.jpg")], 4.0, ",format=nv12,hwupload"
+    )
+
+    assert input_args.count("-i") == 3
+    assert filter_graph.endswith("[v0][v1][v2]concat=n=3:v=1:a=0,format=nv12,hwupload[v]")
+
+
+def test_slideshow_filter_graph_covers_fractional_image_durations() -> None:
+    _input_args, filter_graph = pipeline._slideshow_filter_graph([Path("a.jpg")], 3.03, "")
+
+    # 3.03 s at 5 fps needs 16 frames; rounding to 15 would end the video before the audio.
+    assert "loop=loop=15:size=1" in filter_graph
+
+
+def test_fetch_related_images_skips_failed_downloads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeResponse:
+        status_code = 200
+        headers: dict[str, str] = {}
+
+        def __enter__(self) -> "FakeResponse":
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int):
+            yield b"jpeg"
+
+    class FakeSession:
+        def mount(self, prefix: str, adapter: object) -> None:
+            pass
+
+        def get(self, url: str, **kwargs: object) -> FakeResponse:
+            if url.endswith("bad.jpg"):
+                raise pipeline.requests.exceptions.RetryError("too many 503 error responses")
+            return FakeResponse()
+
+    pages = {
+        str(idx): {"imageinfo": [{"url": f"https://example.org/{name}", "mime": "image/jpeg"}]}
+        for idx, name in enumerate(["good1.jpg", "bad.jpg", "good2.jpg"])
+    }
+    monkeypatch.setattr(pipeline.requests, "Session", FakeSession)
+    monkeypatch.setattr(pipeline, "_search_commons", lambda *args: pages)
+
+    images = pipeline.fetch_related_images("placebo", tmp_path, count=3)
+
+    assert len(images) == 2
+    assert all(image.read_bytes() == b"jpeg" for image in images)
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_tts_chunk_dir_changes_with_chunk_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    before = pipeline._tts_chunk_dir("पहला वाक्य है।", "hi")
+    monkeypatch.setitem(pipeline.MAX_CHARS_BY_LANG, "hi", 1000)
+
+    assert pipeline._tts_chunk_dir("पहला वाक्य है।", "hi") != before
+
+
+def test_extract_text_from_empty_pdf_raises_value_error(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "empty.pdf"
+    pdf_path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="No extractable text found in PDF"):
+        pipeline.extract_text_from_pdf(pdf_path)
+
+
+def test_build_hindi_video_probes_each_chunk_without_mutagen(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    chunk_paths = [tmp_path / "chunk_0001.mp3", tmp_path / "chunk_0002.mp3"]
+    probed: list[str] = []
+    rendered: list[float] = []
+
+    def fake_run(cmd: list[str], **kwargs: object):
+        probed.append(cmd[-1])
+        return pipeline.subprocess.CompletedProcess(cmd, 0, stdout="2.5\n", stderr="")
+
+    def fake_synthesize(text: str, chunk_dir: Path, **kwargs: object) -> list[Path]:
+        chunk_dir.mkdir(parents=True)
+        return chunk_paths
+
+    monkeypatch.setattr(pipeline, "mutagen", None)
+    monkeypatch.setattr(pipeline, "ensure_ffmpeg", lambda _binary: None)
+    monkeypatch.setattr(pipeline, "TTS_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(pipeline, "synthesize_tts_chunks", fake_synthesize)
+    monkeypatch.setattr(pipeline.subprocess, "run", fake_run)
+    monkeypatch.setattr(pipeline, "_render_video", lambda _audio, duration, *args: rendered.append(duration))
+
+    pipeline.build_hindi_video_from_text("पहला वाक्य है।", [Path("a.jpg")], tmp_path / "out.mp4")
+
+    assert probed == [str(path) for path in chunk_paths]
+    assert rendered == [5.0]
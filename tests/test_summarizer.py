@@ -1,7 +1,17 @@
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
+from src import hindi_audiobook_summary
 from src.hindi_audiobook_summary import (
+    _slideshow_filter_graph,
+    create_audio,
+    iter_sections,
     pick_related_images,
+    read_source_text,
+    score_sentences_tfidf,
     split_sections,
     split_sentences,
     summarize_text,
@@ -20,6 +30,40 @@ def test_split_sections_with_chapters() -> None:
     assert "पहली कहानी" in sections[0].content
 
 
+def test_iter_sections_matches_split_sections_across_pages() -> None:
+    pages = [
+        "भूमिका का पाठ।\nअध्याय 1: शुरुआत\nपहली",
+        "कहानी है।\nअध्याय",
+        "2: मोड़\nयह दूसरी कहानी है।",
+    ]
+
+    streamed = list(iter_sections(pages))
+
+    assert streamed == split_sections("\n".join(pages))
+    assert [s.title for s in streamed] == ["अध्याय 1: शुरुआत", "अध्याय\n2: मोड़"]
+    assert streamed[0].content == "पहली\nकहानी है।"
+
+
+def test_iter_sections_scans_each_page_once_without_headings(monkeypatch: pytest.MonkeyPatch) -> None:
+    chapter_re = hindi_audiobook_summary._CHAPTER_RE
+    scanned: list[int] = []
+
+    class CountingPattern:
+        def finditer(self, text: str):
+            scanned.append(len(text))
+            return chapter_re.finditer(text)
+
+    monkeypatch.setattr(hindi_audiobook_summary, "_CHAPTER_RE", CountingPattern())
+    page = "यह एक वाक्य है। " * 50 + "\nअंतिम पंक्ति।"
+    pages = [page] * 400
+
+    sections = list(iter_sections(pages))
+
+    assert [s.content for s in sections] == ["\n".join(pages)]
+    # Linear: every page is scanned with at most the previous page's last line carried over.
+    assert sum(scanned) <= len(pages) * (len(page) + len("\nअंतिम पंक्ति।"))
+
+
 def test_split_sentences_hindi_punctuation() -> None:
     text = "यह पहला वाक्य है। यह दूसरा वाक्य है! क्या यह तीसरा वाक्य है? हाँ।"
     sentences = split_sentences(text)
@@ -38,6 +82,24 @@ def test_summarize_text_returns_content() -> None:
     assert len(summary) > 20
 
 
+def test_summarize_text_keeps_repeated_sentences() -> None:
+    text = "अभ्यास जरूरी है। अभ्यास से सफलता मिलती है। मौसम अच्छा था। अभ्यास जरूरी है।"
+
+    summary = summarize_text(text, ratio=0.75, min_sentences=2)
+
+    assert summary.count("अभ्यास जरूरी है।") == 2
+    assert "मौसम" not in summary
+
+
+def test_score_sentences_tfidf_favors_distinctive_sentences() -> None:
+    sentences = ["अभ्यास जरूरी है।", "अभ्यास से सफलता।", "अभ्यास और धैर्य से आत्मविश्वास आता है।"]
+
+    scores = score_sentences_tfidf(sentences)
+
+    assert len(scores) == 3
+    assert scores[2] > scores[0]
+
+
 def test_pick_related_images_scores_filenames(tmp_path: Path) -> None:
     (tmp_path / "mindset_growth.jpg").write_bytes(b"x")
     (tmp_path / "health_sleep.png").write_bytes(b"x")
@@ -48,3 +110,141 @@ def test_pick_related_images_scores_filenames(tmp_path: Path) -> None:
 
     assert ranked[0].name in {"mindset_growth.jpg", "health_sleep.png"}
     assert len(ranked) == 3
+
+
+def test_read_source_text_caches_pdf_text(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Path] = []
+
+    def fake_extract(pdf_path: Path) -> str:
+        calls.append(pdf_path)
+        return "अध्याय 1\nयह पाठ है।"
+
+    monkeypatch.setattr(hindi_audiobook_summary, "TEXT_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(hindi_audiobook_summary, "extract_pdf_text", fake_extract)
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    assert read_source_text(pdf_path) == "अध्याय 1\nयह पाठ है।"
+    assert read_source_text(pdf_path) == "अध्याय 1\nयह पाठ है।"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(hindi_audiobook_summary, "CACHE_VERSION", hindi_audiobook_summary.CACHE_VERSION + 1)
+    read_source_text(pdf_path)
+    assert len(calls) == 2
+
+
+def test_get_audio_duration_probes_bytes_from_a_file_without_mutagen(monkeypatch: pytest.MonkeyPatch) -> None:
+    probed: list[bytes] = []
+
+    def fake_run(cmd: list[str], **kwargs: object):
+        probed.append(Path(cmd[-1]).read_bytes())
+        return subprocess.CompletedProcess(cmd, 0, stdout="12.5\n", stderr="")
+
+    monkeypatch.setitem(sys.modules, "mutagen", None)
+    monkeypatch.setattr(hindi_audiobook_summary.shutil, "which", lambda _name: "/usr/bin/ffprobe")
+    monkeypatch.setattr(hindi_audiobook_summary.subprocess, "run", fake_run)
+
+    assert hindi_audiobook_summary.get_audio_duration_seconds(b"mp3-bytes") == 12.5
+    assert probed == [b"mp3-bytes"]
+
+
+def test_extract_pdf_text_rejects_empty_file(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "empty.pdf"
+    pdf_path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="No extractable text found in PDF"):
+        hindi_audiobook_summary.extract_pdf_text(pdf_path)
+
+
+def test_slideshow_filter_graph_concats_every_image() -> None:
+    images = [Path("a.jpg"), Path("b.png")]
+
+    input_args, filter_graph = _slideshow_filter_graph(images, seconds_per_image=4.0)
+
+    assert input_args.count("-i") == 2
+    # Images are read once and repeated after scaling: 4 s at 5 fps is 20 frames.
+    assert "-loop" not in input_args
+    assert filter_graph.count("loop=loop=19:size=1") == 2
+    assert "[0:v]" in filter_graph and "[1:v]" in filter_graph
+    assert filter_graph.endswith("[v0][v1]concat=n=2:v=1:a=0[v]")
+
+
+def test_create_audio_joins_chapter_audio_in_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import gtts
+
+    class FakeTTS:
+        def __init__(self, text: str, lang: str) -> None:
+            self.text = text
+
+        def write_to_fp(self, fp) -> None:
+            fp.write(self.text.split("\n")[0].encode("utf-8"))
+
+    monkeypatch.setattr(gtts, "gTTS", FakeTTS)
+    output_path = tmp_path / "summary.mp3"
+
+    create_audio("अध्याय 1\nपहला सार।\n\nअध्याय 2\nदूसरा सार।", output_path)
+
+    assert output_path.read_bytes().decode("utf-8") == "अध्याय 1अध्याय 2"
+
+
+def test_main_times_video_by_every_audio_part(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    parts = [b"chapter-one", b"chapter-two"]
+    rendered: list[tuple[bytes, float]] = []
+    durations = {b"chapter-one": 10.5, b"chapter-two": 9.25}
+
+    monkeypatch.setattr(hindi_audiobook_summary, "TEXT_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(hindi_audiobook_summary, "synthesize_audio", lambda _summary: parts)
+    monkeypatch.setattr(hindi_audiobook_summary, "get_audio_duration_seconds", durations.__getitem__)
+    monkeypatch.setattr(hindi_audiobook_summary, "pick_related_images", lambda _summary, _dir: [Path("a.jpg")])
+    monkeypatch.setattr(hindi_audiobook_summary.shutil, "which", lambda _name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(hindi_audiobook_summary, "_nvenc_available", lambda: False)
+    monkeypatch.setattr(
+        hindi_audiobook_summary,
+        "create_video_from_audio",
+        lambda audio, _images, _output, duration: rendered.append((audio, duration)),
+    )
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "hindi_audiobook_summary.py",
+            "--input",
+            str(Path(__file__).resolve().parents[1] / "examples" / "book.txt"),
+            "--summary-output",
+            str(tmp_path / "summary.txt"),
+            "--video-output",
+            str(tmp_path / "video.mp4"),
+            "--images-dir",
+            str(tmp_path),
+        ],
+    )
+
+    hindi_audiobook_summary.main()
+
+    assert rendered == [(b"chapter-onechapter-two", 19.75)]
+
+
+def test_main_checks_images_before_synthesizing_audio(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    synthesized: list[str] = []
+
+    monkeypatch.setattr(hindi_audiobook_summary, "TEXT_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(hindi_audiobook_summary, "synthesize_audio", synthesized.append)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "hindi_audiobook_summary.py",
+            "--input",
+            str(Path(__file__).resolve().parents[1] / "examples" / "book.txt"),
+            "--summary-output",
+            str(tmp_path / "summary.txt"),
+            "--video-output",
+            str(tmp_path / "video.mp4"),
+            "--images-dir",
+            str(tmp_path),
+        ],
+    )
+
+    with pytest.raises(ValueError, match="No images found"):
+        hindi_audiobook_summary.main()
+    assert synthesized == []